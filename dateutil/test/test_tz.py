@@ -15,6 +15,9 @@ import sys
 import base64
 import copy
 import gc
+import os
+import threading
+import time
 import weakref
 
 from functools import partial
@@ -735,6 +738,13 @@ class TzOffsetTest(unittest.TestCase):
 
         assert tz1 is tz2
 
+    def testTzOffsetStrSubclassName(self):
+        class StrSubclass(str):
+            pass
+
+        tzo = tz.tzoffset(StrSubclass('XYZ'), 3600)
+        self.assertEqual(datetime(2020, 1, 1, tzinfo=tzo).tzname(), 'XYZ')
+
 
 @pytest.mark.smoke
 @pytest.mark.tzoffset
@@ -1004,6 +1014,82 @@ def test_tzlocal_offset_equal(tzvar, tzoff):
         assert not (tz.tzlocal() != tzoff)
 
 
+@mark_tzlocal_nix
+def test_tzlocal_is():
+    with TZEnvContext('EST+5EDT,M3.2.0/2,M11.1.0/2'):
+        tzl1 = tz.tzlocal()
+        assert tz.tzlocal() is tzl1
+
+    with TZEnvContext('EST+5EDT,M4.1.0/2,M10.5.0/2'):
+        assert tz.tzlocal() is not tzl1
+
+
+@mark_tzlocal_nix
+def test_tzlocal_weakref():
+    with TZEnvContext('EST+5EDT,M3.2.0/2,M11.1.0/2'):
+        tzl_ref = weakref.ref(tz.tzlocal())
+        gc.collect()
+
+        assert tzl_ref() is not None    # Should be in the strong cache
+        assert tz.tzlocal() is tzl_ref()
+
+    # Fill the strong cache with other configurations
+    for offset in range(5, 15):
+        with TZEnvContext('GMT+{}'.format(offset)):
+            tz.tzlocal()
+    gc.collect()
+
+    assert tzl_ref() is None
+
+
+@mark_tzlocal_nix
+def test_tzlocal_pickle_without_isdst_cache():
+    with TZEnvContext('EST+5EDT,M3.2.0/2,M11.1.0/2'):
+        tzl = tz.tzlocal()
+        assert tzl.utcoffset(datetime(2020, 7, 1)) == timedelta(hours=-4)
+
+        state = tzl.__getstate__()
+        assert '_isdst_cache' not in state
+
+        # Pickles from versions without the cache have the same state
+        tzl_old = tz.tzlocal.__new__(tz.tzlocal)
+        tzl_old.__dict__.update(state)
+        assert tzl_old.utcoffset(datetime(2020, 7, 1)) == timedelta(hours=-4)
+
+
+@mark_tzlocal_nix
+def test_tzlocal_transition_with_seconds():
+    # Transitions need not fall on whole minutes, so seconds either side of
+    # one must not share a result.
+    with TZEnvContext('EST5EDT,M3.2.0/2:00:30,M11.1.0/2:00:30'):
+        tzl = tz.tzlocal()
+        EST = timedelta(hours=-5)
+        EDT = timedelta(hours=-4)
+
+        assert tzl.utcoffset(datetime(2020, 3, 8, 2, 0, 15)) == EST
+        assert tzl.utcoffset(datetime(2020, 3, 8, 2, 0, 45)) == EDT
+
+        assert not tzl.is_ambiguous(datetime(2020, 11, 1, 1, 0, 15))
+        assert tzl.is_ambiguous(datetime(2020, 11, 1, 1, 0, 45))
+        assert tzl.is_ambiguous(datetime(2020, 11, 1, 2, 0, 15))
+        assert not tzl.is_ambiguous(datetime(2020, 11, 1, 2, 0, 45))
+
+
+@mark_tzlocal_nix
+def test_tzlocal_sub_hour_fold():
+    # Lord Howe Island has a 30 minute DST offset, so only the second half of
+    # the hour before the transition is ambiguous.
+    with TZEnvContext('LHST-10:30LHDT-11,M10.1.0,M4.1.0'):
+        tzl = tz.tzlocal()
+
+        offsets = [tz.enfold(datetime(2015, 4, 5, 1, minute, tzinfo=tzl),
+                             fold=fold).utcoffset()
+                   for minute in (15, 45) for fold in (0, 1)]
+
+    assert offsets == [timedelta(hours=11), timedelta(hours=11),
+                       timedelta(hours=11), timedelta(hours=10, minutes=30)]
+
+
 @mark_tzlocal_nix
 @pytest.mark.parametrize('tzvar, tzoff', [
     ('EST5EDT', tz.tzoffset('EST', -18000)),
@@ -1089,6 +1175,22 @@ def test_gettz_badzone(badzone):
     assert tzi is None
 
 
+@pytest.mark.gettz
+@pytest.mark.parametrize('name', ['UTC', ':UTC', 'Etc/UTC', 'Zulu'])
+def test_gettz_utc_singleton(name):
+    assert tz.gettz(name) is tz.UTC
+    assert tz.gettz.nocache(name) is tz.UTC
+
+
+@pytest.mark.gettz
+def test_gettz_str_subclass_name():
+    class StrSubclass(str):
+        pass
+
+    tzi = tz.gettz(StrSubclass('America/New_York'))
+    assert tzi is tz.gettz('America/New_York')
+
+
 @pytest.mark.gettz
 def test_gettz_badzone_unicode():
     # Make sure a unicode string can be passed to TZ (GH #802)
@@ -1158,6 +1260,25 @@ def test_gettz_set_cache_size():
 
     assert MONACO_ref() is None
 
+
+@pytest.mark.gettz
+@pytest.mark.xfail(IS_WIN, reason='zoneinfo separately cached')
+def test_gettz_set_cache_size_shrink_keeps_identity():
+    tz.gettz.cache_clear()
+    tz.gettz.set_cache_size(3)
+    names = ['Europe/Monaco', 'Pacific/Easter', 'Australia/Currie']
+    zones = [tz.gettz(name) for name in names]
+
+    try:
+        tz.gettz.set_cache_size(0)
+        gc.collect()
+
+        # Zones still referenced elsewhere come back from the weak cache
+        assert all(tz.gettz(name) is zone for name, zone in zip(names, zones))
+    finally:
+        tz.gettz.set_cache_size(8)
+
+
 @pytest.mark.xfail(IS_WIN, reason="Windows does not use system zoneinfo")
 @pytest.mark.smoke
 @pytest.mark.gettz
@@ -1184,6 +1305,203 @@ def test_gettz_weakref():
     assert NYC_ref() is None    # Should have been pushed out
     assert tz.gettz('America/New_York') is not NYC_ref()
 
+
+@pytest.mark.xfail(IS_WIN, reason="Windows does not use system zoneinfo")
+@pytest.mark.gettz
+def test_gettz_threaded():
+    tz.gettz.cache_clear()
+    names = ['America/New_York', 'Europe/Monaco', 'Pacific/Easter']
+    results = []
+
+    def worker():
+        results.append([tz.gettz(name) for name in names * 50])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    expected = [tz.gettz(name) for name in names * 50]
+    assert len(results) == len(threads)
+    for result in results:
+        assert all(a is b for a, b in zip(result, expected))
+
+
+@pytest.mark.gettz
+def test_gettz_concurrent_misses_load_once(monkeypatch):
+    tz.gettz.cache_clear()
+    nocache = tz.gettz.nocache
+    loaded = []
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_nocache(name=None):
+        loaded.append(name)
+        if name == 'Europe/Monaco':
+            loading.set()
+            release.wait(5)
+        return nocache(name)
+
+    # Record when threads start waiting on another thread's load
+    waiting = []
+
+    class RecordingEvent(object):
+        def __init__(self):
+            self._event = threading.Event()
+
+        def wait(self, timeout=None):
+            waiting.append(self)
+            return self._event.wait(timeout)
+
+        def set(self):
+            self._event.set()
+
+    class recording_threading(object):
+        Event = RecordingEvent
+
+    monkeypatch.setattr(type(tz.gettz), 'nocache', staticmethod(slow_nocache))
+    monkeypatch.setattr(tz.tz, 'threading', recording_threading)
+
+    results = []
+    waiters = []
+
+    def get_monaco():
+        results.append(tz.gettz('Europe/Monaco'))
+
+    def start(target):
+        thread = threading.Thread(target=target)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    try:
+        loader = start(get_monaco)
+        assert loading.wait(5)
+
+        # A miss on another name is not held up by the slow load
+        other = start(lambda: tz.gettz('Pacific/Easter'))
+        other.join(5)
+        assert not other.is_alive()
+
+        # Misses on the same name wait for the load in progress
+        waiters.extend(start(get_monaco) for _ in range(3))
+        deadline = time.time() + 5
+        while len(waiting) < len(waiters) and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(waiting) == len(waiters)
+    finally:
+        release.set()
+
+    for thread in [loader] + waiters:
+        thread.join(5)
+
+    assert loaded.count('Europe/Monaco') == 1
+    assert len(results) == 1 + len(waiters)
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.xfail(IS_WIN, reason="Windows does not use system zoneinfo")
+@pytest.mark.gettz
+@pytest.mark.parametrize('name', ['America/New_York', 'Not/A_Zone', None])
+def test_gettz_nocache_tzpath_cache(name, monkeypatch):
+    monkeypatch.delenv('TZ', raising=False)
+    monkeypatch.setattr(tz.tz, 'TZPATHS', ['/nonexistent'] + tz.TZPATHS)
+    tz.gettz.cache_clear()
+    tz1 = tz.gettz.nocache(name)
+    if name is None and not isinstance(tz1, tz.tzfile):
+        pytest.skip('no local zone file to remember')
+
+    probed = []
+    stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        probed.append(path)
+        return stat(path, *args, **kwargs)
+
+    def counting_open(path, *args, **kwargs):
+        probed.append(path)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, 'stat', counting_stat)
+    monkeypatch.setattr(tz.tz, 'open', counting_open, raising=False)
+
+    tz2 = tz.gettz.nocache(name)
+    assert tz1 == tz2
+    assert not any(path.startswith('/nonexistent') for path in probed)
+
+    cached_probes = len(probed)
+    del probed[:]
+
+    tz.gettz.cache_clear()
+    tz.gettz.nocache(name)
+    assert len(probed) > cached_probes
+
+
+@pytest.mark.xfail(IS_WIN, reason="Windows does not use system zoneinfo")
+@pytest.mark.gettz
+def test_gettz_nocache_rereads_changed_file(tmpdir):
+    tz.gettz.cache_clear()
+    with open(tz.gettz('America/New_York')._filename, 'rb') as f:
+        nyc_data = f.read()
+    with open(tz.gettz('Europe/London')._filename, 'rb') as f:
+        london_data = f.read()
+
+    zone_file = tmpdir.join('zone')
+    zone_file.write_binary(nyc_data)
+    zone_path = str(zone_file)
+
+    dt = datetime(2020, 1, 1)
+    assert tz.gettz.nocache(zone_path).utcoffset(dt) == timedelta(hours=-5)
+    assert tz.gettz.nocache(zone_path).utcoffset(dt) == timedelta(hours=-5)
+
+    zone_file.write_binary(london_data)
+    os.utime(zone_path, (0, 0))
+    assert tz.gettz.nocache(zone_path).utcoffset(dt) == timedelta(0)
+
+
+@pytest.mark.xfail(IS_WIN, reason="Windows does not use system zoneinfo")
+@pytest.mark.gettz
+def test_gettz_nocache_local_zone_created_later(tmpdir, monkeypatch):
+    monkeypatch.delenv('TZ', raising=False)
+    localtime = tmpdir.join('localtime')
+    monkeypatch.setattr(tz.tz, 'TZFILES', [str(localtime)])
+    tz.gettz.cache_clear()
+
+    assert isinstance(tz.gettz.nocache(), tz.tzlocal)
+
+    # A local zone file that appears later is used without cache_clear()
+    with open(tz.gettz('America/New_York')._filename, 'rb') as f:
+        localtime.write_binary(f.read())
+
+    tzl = tz.gettz.nocache()
+    assert isinstance(tzl, tz.tzfile)
+    assert tzl.utcoffset(datetime(2020, 1, 1)) == timedelta(hours=-5)
+
+
+@pytest.mark.xfail(IS_WIN, reason="Windows does not use system zoneinfo")
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason='requires symlinks')
+@pytest.mark.gettz
+def test_gettz_nocache_follows_repointed_symlink(tmpdir):
+    # Zone files installed together share an mtime, and these two also
+    # share a size, so only the file identity tells them apart.
+    tz.gettz.cache_clear()
+    plus1 = tz.gettz('Etc/GMT+1')._filename
+    plus2 = tz.gettz('Etc/GMT+2')._filename
+    if os.path.getsize(plus1) != os.path.getsize(plus2):
+        pytest.skip('zone files differ in size')
+
+    link = str(tmpdir.join('localtime'))
+    dt = datetime(2020, 1, 1)
+
+    os.symlink(plus1, link)
+    assert tz.gettz.nocache(link).utcoffset(dt) == timedelta(hours=-1)
+
+    os.remove(link)
+    os.symlink(plus2, link)
+    assert tz.gettz.nocache(link).utcoffset(dt) == timedelta(hours=-2)
+
+
 class ZoneInfoGettzTest(GettzTest):
     def gettz(self, name):
         zoneinfo_file = zoneinfo.get_zonefile_instance()
@@ -1635,7 +1953,8 @@ def test_valid_dateutil_format(tz_str, expected):
     '-1:WART4WARST,J1,J365/25',
     'WART4WARST,J1,J365/-25',
     'IST-2IDT,M3.4.-1/26,M10.5.0',
-    'IST-2IDT,M3,2000,1/26,M10,5,0'
+    'IST-2IDT,M3,2000,1/26,M10,5,0',
+    'EST5EDT,M3.2.0/2,M11.1.0/2\n',
 ])
 def test_invalid_GNU_tzstr(tz_str):
     with pytest.raises(ValueError):
@@ -1970,6 +2289,30 @@ class TZICalTest(unittest.TestCase, TzFoldMixin):
         with self.assertRaises(ValueError):
             tz.tzical(StringIO(tz_str))
 
+    def testInvalidOffset(self):
+        tz_str = TZICAL_EST5EDT.replace('TZOFFSETTO:-0400', 'TZOFFSETTO:-04')
+        with self.assertRaises(ValueError):
+            tz.tzical(StringIO(tz_str))
+
+    @pytest.mark.skipif(not SUPPORTS_SUB_MINUTE_OFFSETS,
+                        reason='Sub-minute offsets not supported')
+    def testOffsetSeconds(self):
+        tz_str = TZICAL_EST5EDT.replace('TZOFFSETTO:-0500', 'TZOFFSETTO:-045602')
+        tzc = tz.tzical(StringIO(tz_str)).get()
+
+        self.assertEqual(datetime(2003, 1, 1, tzinfo=tzc).utcoffset(),
+                         -timedelta(hours=4, minutes=56, seconds=2))
+
+    def testManyYears(self):
+        tzc = tz.tzical(StringIO(TZICAL_EST5EDT)).get()
+
+        for year in range(1990, 2190):
+            self.assertEqual(datetime(year, 7, 1, tzinfo=tzc).tzname(), 'EDT')
+            self.assertEqual(datetime(year, 1, 1, tzinfo=tzc).tzname(), 'EST')
+
+        self.assertLessEqual(len(tzc._transitions_by_year),
+                             tzc._transitions_by_year_size)
+
     # Test Parsing
     def testGap(self):
         tzic = tz.tzical(StringIO('\n'.join((TZICAL_EST5EDT, TZICAL_PST8PDT))))
@@ -2384,6 +2727,15 @@ class TzPickleTest(PicklableMixin, unittest.TestCase):
     def testPickleTzOffsetNeg(self):
         self.assertPicklable(tz.tzoffset('UTC-1', -3600), singleton=True)
 
+    def testTzOffsetStateWithoutOffsetSeconds(self):
+        # Pickles from versions that didn't store _offset_seconds
+        state = tz.tzoffset('UTC+1', 3600).__dict__.copy()
+        del state['_offset_seconds']
+
+        tzo_old = tz.tzoffset.__new__(tz.tzoffset)
+        tzo_old.__dict__.update(state)
+        self.assertEqual(repr(tzo_old), "tzoffset(%s, 3600)" % repr('UTC+1'))
+
     @pytest.mark.tzlocal
     def testPickleTzLocal(self):
         self.assertPicklable(tz.tzlocal())
@@ -2400,6 +2752,25 @@ class TzPickleTest(PicklableMixin, unittest.TestCase):
         tzc = tz.tzfile(BytesIO(base64.b64decode(NEW_YORK)))
         self.assertPicklable(tzc)
 
+    def testPickleTzRange(self):
+        self.assertPicklable(tz.tzrange('EST', -18000, 'EDT'))
+
+    def testPickleTzStr(self):
+        self.assertPicklable(tz.tzstr('EST5EDT,M3.2.0/2,M11.1.0/2'))
+
+    def testTzRangeStateWithoutCache(self):
+        # Pickles from versions without the transitions cache
+        for tzi in (tz.tzrange('EST', -18000, 'EDT'),
+                    tz.tzstr('EST5EDT,M3.2.0/2,M11.1.0/2')):
+            tzi.utcoffset(datetime(2020, 7, 1))
+            state = tzi.__getstate__()
+            self.assertNotIn('_transitions_cache', state)
+
+            tzi_old = type(tzi).__new__(type(tzi))
+            tzi_old.__dict__.update(state)
+            self.assertEqual(tzi_old.utcoffset(datetime(2020, 7, 1)),
+                             timedelta(hours=-4))
+
     @unittest.skip("Known failure")
     def testPickleTzICal(self):
         tzc = tz.tzical(StringIO(TZICAL_EST5EDT)).get()
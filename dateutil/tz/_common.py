@@ -201,8 +201,12 @@ class _tzinfo(tzinfo):
 
         return _fold
 
-    def _fold(self, dt):
-        return getattr(dt, 'fold', 0)
+    if hasattr(datetime, 'fold'):
+        def _fold(self, dt):
+            return dt.fold
+    else:
+        def _fold(self, dt):
+            return getattr(dt, 'fold', 0)
 
     def _fromutc(self, dt):
         """
@@ -1,4 +1,6 @@
 from datetime import timedelta
+import os
+import time
 import weakref
 from collections import OrderedDict
 
@@ -36,12 +38,20 @@ class _TzOffsetFactory(_TzFactory):
         else:
             key = (name, offset)
 
+        # This lock may not be necessary in Python 3. See GH issue #901
+        with cls._cache_lock:
+            # Recently used instances are served straight from the strong
+            # cache, without going through the weak cache.
+            instance = cls.__strong_cache.pop(key, None)
+            if instance is not None:
+                cls.__strong_cache[key] = instance
+                return instance
+
         instance = cls.__instances.get(key, None)
         if instance is None:
             instance = cls.__instances.setdefault(key,
                                                   cls.instance(name, offset))
 
-        # This lock may not be necessary in Python 3. See GH issue #901
         with cls._cache_lock:
             cls.__strong_cache[key] = cls.__strong_cache.pop(key, instance)
 
@@ -52,6 +62,35 @@ class _TzOffsetFactory(_TzFactory):
         return instance
 
 
+class _TzLocalFactory(_TzFactory):
+    def __init__(cls, *args, **kwargs):
+        cls.__instances = weakref.WeakValueDictionary()
+        cls.__strong_cache = OrderedDict()
+        cls.__strong_cache_size = 8
+
+        cls.__cache_lock = _thread.allocate_lock()
+
+    def __call__(cls):
+        # tzlocal depends only on the process's time zone settings, so one
+        # instance is shared for each distinct configuration.
+        key = (os.environ.get('TZ'), time.timezone, time.altzone,
+               time.daylight, tuple(time.tzname))
+        instance = cls.__instances.get(key, None)
+
+        if instance is None:
+            instance = cls.__instances.setdefault(key, cls.instance())
+
+        # This lock may not be necessary in Python 3. See GH issue #901
+        with cls.__cache_lock:
+            cls.__strong_cache[key] = cls.__strong_cache.pop(key, instance)
+
+            # Remove an item if the strong cache is overpopulated
+            if len(cls.__strong_cache) > cls.__strong_cache_size:
+                cls.__strong_cache.popitem(last=False)
+
+        return instance
+
+
 class _TzStrFactory(_TzFactory):
     def __init__(cls, *args, **kwargs):
         cls.__instances = weakref.WeakValueDictionary()
@@ -8,23 +8,25 @@ from relative deltas), local machine timezone, fixed offset timezone, and UTC
 timezone.
 """
 import datetime
+import re
 import struct
 import time
 import sys
 import os
 import bisect
+import threading
 import weakref
 from collections import OrderedDict
 
 import six
 from six import string_types
-from six.moves import _thread
+from six.moves import _thread, intern
 from ._common import tzname_in_python2, _tzinfo
 from ._common import tzrangebase, enfold
 from ._common import _validate_fromutc_inputs
 
 from ._factories import _TzSingleton, _TzOffsetFactory
-from ._factories import _TzStrFactory
+from ._factories import _TzStrFactory, _TzLocalFactory
 try:
     from .win import tzwin, tzwinlocal
 except ImportError:
@@ -37,6 +39,21 @@ ZERO = datetime.timedelta(0)
 EPOCH = datetime.datetime.utcfromtimestamp(0)
 EPOCHORDINAL = EPOCH.toordinal()
 
+# Fixed-size records of the tzfile(5) format
+_TZFILE_HEADER = struct.Struct(">6l")
+_TZFILE_TTINFO = struct.Struct(">lbb")
+
+# iCalendar UTC offset: [+-]HHMM[SS]
+_ICAL_OFFSET_RE = re.compile(r'([+-]?)(\d{2})(\d{2})(\d{2})?$')
+
+# Zone names that gettz maps straight to the UTC singleton. The GMT aliases
+# are left out, since their zone files give the abbreviation "GMT".
+_UTC_ZONE_NAMES = frozenset(("UTC", "Etc/UTC", "Universal", "Etc/Universal",
+                             "Zulu", "Etc/Zulu"))
+
+# gettz only treats a name as a TZ string if it contains an offset
+_HAS_DIGIT_RE = re.compile('[0-9]')
+
 
 @six.add_metaclass(_TzSingleton)
 class tzutc(datetime.tzinfo):
@@ -97,15 +114,25 @@ class tzutc(datetime.tzinfo):
         """
         return False
 
-    @_validate_fromutc_inputs
     def fromutc(self, dt):
         """
         Fast track version of fromutc() returns the original ``dt`` object for
         any valid :py:class:`datetime.datetime` object.
         """
+        # Same checks as _validate_fromutc_inputs, inlined to save a call on
+        # this very hot path.
+        if not isinstance(dt, datetime.datetime):
+            raise TypeError("fromutc() requires a datetime argument")
+        if dt.tzinfo is not self:
+            raise ValueError("dt.tzinfo is not self")
+
         return dt
 
     def __eq__(self, other):
+        # tzutc is a singleton, so this is by far the most common case
+        if other is self:
+            return True
+
         if not isinstance(other, (tzutc, tzoffset)):
             return NotImplemented
 
@@ -141,7 +168,7 @@ class tzoffset(datetime.tzinfo):
         as a :py:class:`datetime.timedelta` object).
     """
     def __init__(self, name, offset):
-        self._name = name
+        self._name = _intern_name(name)
 
         try:
             # Allow a timedelta
@@ -150,6 +177,7 @@ class tzoffset(datetime.tzinfo):
             pass
 
         self._offset = datetime.timedelta(seconds=_get_supported_offset(offset))
+        self._offset_seconds = int(self._offset.total_seconds())
 
     def utcoffset(self, dt):
         return self._offset
@@ -191,16 +219,26 @@ class tzoffset(datetime.tzinfo):
         return not (self == other)
 
     def __repr__(self):
+        offset_seconds = self.__dict__.get('_offset_seconds', None)
+        if offset_seconds is None:
+            # Instances unpickled from older versions don't store it
+            offset_seconds = int(self._offset.total_seconds())
+
         return "%s(%s, %s)" % (self.__class__.__name__,
                                repr(self._name),
-                               int(self._offset.total_seconds()))
+                               offset_seconds)
 
     __reduce__ = object.__reduce__
 
 
+@six.add_metaclass(_TzLocalFactory)
 class tzlocal(_tzinfo):
     """
     A :class:`tzinfo` subclass built around the ``time`` timezone functions.
+
+    Calls to ``tzlocal()`` made under the same local time zone settings (the
+    ``TZ`` environment variable and the values exposed by :mod:`time`) return
+    the same object.
     """
     def __init__(self):
         super(tzlocal, self).__init__()
@@ -213,10 +251,19 @@ class tzlocal(_tzinfo):
 
         self._dst_saved = self._dst_offset - self._std_offset
         self._hasdst = bool(self._dst_saved)
-        self._tznames = tuple(time.tzname)
+        self._tznames = tuple(_intern_name(name) for name in time.tzname)
+
+    # Size of the _naive_is_dst cache. The cache itself is created on first
+    # use, so that it is left out of pickles and instances unpickled from
+    # older versions work.
+    _isdst_cache_size = 512
 
     def utcoffset(self, dt):
-        if dt is None and self._hasdst:
+        # Without DST the answer is fixed, so skip the DST lookup entirely
+        if not self._hasdst:
+            return self._std_offset
+
+        if dt is None:
             return None
 
         if self._isdst(dt):
@@ -225,7 +272,10 @@ class tzlocal(_tzinfo):
             return self._std_offset
 
     def dst(self, dt):
-        if dt is None and self._hasdst:
+        if not self._hasdst:
+            return ZERO
+
+        if dt is None:
             return None
 
         if self._isdst(dt):
@@ -235,6 +285,9 @@ class tzlocal(_tzinfo):
 
     @tzname_in_python2
     def tzname(self, dt):
+        if not self._hasdst:
+            return self._tznames[0]
+
         return self._tznames[self._isdst(dt)]
 
     def is_ambiguous(self, dt):
@@ -251,13 +304,33 @@ class tzlocal(_tzinfo):
 
         .. versionadded:: 2.6.0
         """
-        naive_dst = self._naive_is_dst(dt)
+        return self._is_ambiguous_given(dt, self._naive_is_dst(dt))
+
+    def _is_ambiguous_given(self, dt, naive_dst):
+        # Ambiguity check for when _naive_is_dst(dt) is already known
         return (not naive_dst and
                 (naive_dst != self._naive_is_dst(dt - self._dst_saved)))
 
     def _naive_is_dst(self, dt):
-        timestamp = _datetime_to_timestamp(dt)
-        return time.localtime(timestamp + time.timezone).tm_isdst
+        # time.localtime truncates to whole seconds anyway, so the whole-second
+        # timestamp identifies the result exactly.
+        key = _datetime_to_whole_seconds(dt)
+        cache = self.__dict__.get('_isdst_cache', None)
+        if cache is None:
+            cache = self._isdst_cache = {}
+        else:
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+
+        isdst = time.localtime(key + time.timezone).tm_isdst
+
+        if len(cache) >= self._isdst_cache_size:
+            cache.clear()
+        cache[key] = isdst
+
+        return isdst
 
     def _isdst(self, dt, fold_naive=True):
         # We can't use mktime here. It is unstable when deciding if
@@ -289,9 +362,9 @@ class tzlocal(_tzinfo):
 
         # Check for ambiguous times:
         dstval = self._naive_is_dst(dt)
-        fold = getattr(dt, 'fold', None)
 
-        if self.is_ambiguous(dt):
+        if self._is_ambiguous_given(dt, dstval):
+            fold = getattr(dt, 'fold', None)
             if fold is not None:
                 return not self._fold(dt)
             else:
@@ -322,6 +395,11 @@ class tzlocal(_tzinfo):
     def __repr__(self):
         return "%s()" % self.__class__.__name__
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_isdst_cache', None)
+        return state
+
     __reduce__ = object.__reduce__
 
 
@@ -471,11 +549,11 @@ class tzfile(_tzinfo):
             self._filename = repr(fileobj)
 
         if fileobj is not None:
-            if not file_opened_here:
-                fileobj = _nullcontext(fileobj)
-
-            with fileobj as file_stream:
-                tzobj = self._read_tzfile(file_stream)
+            if file_opened_here:
+                with fileobj as file_stream:
+                    tzobj = self._read_tzfile(file_stream)
+            else:
+                tzobj = self._read_tzfile(fileobj)
 
             self._set_tzdata(tzobj)
 
@@ -525,7 +603,7 @@ class tzfile(_tzinfo):
             # abbreviation strings" stored in the file.
             charcnt,
 
-        ) = struct.unpack(">6l", fileobj.read(24))
+        ) = _TZFILE_HEADER.unpack(fileobj.read(_TZFILE_HEADER.size))
 
         # The above header is followed by tzh_timecnt four-byte
         # values  of  type long,  sorted  in ascending order.
@@ -564,10 +642,10 @@ class tzfile(_tzinfo):
         # time zone abbreviation characters that follow the
         # ttinfo structure(s) in the file.
 
-        ttinfo = []
-
-        for i in range(typecnt):
-            ttinfo.append(struct.unpack(">lbb", fileobj.read(6)))
+        ttinfo_size = _TZFILE_TTINFO.size
+        ttinfo_data = fileobj.read(typecnt * ttinfo_size)
+        ttinfo = [_TZFILE_TTINFO.unpack_from(ttinfo_data, i * ttinfo_size)
+                  for i in range(typecnt)]
 
         abbr = fileobj.read(charcnt).decode()
 
@@ -950,8 +1028,7 @@ class tzrange(tzrangebase):
                  dstabbr=None, dstoffset=None,
                  start=None, end=None):
 
-        global relativedelta
-        from dateutil import relativedelta
+        relativedelta = _get_relativedelta()
 
         self._std_abbr = stdabbr
         self._dst_abbr = dstabbr
@@ -993,6 +1070,11 @@ class tzrange(tzrangebase):
         self._dst_base_offset_ = self._dst_offset - self._std_offset
         self.hasdst = bool(self._start_delta)
 
+    # The same handful of years tend to be queried over and over. The cache
+    # is created on first use, so that it is left out of pickles and
+    # instances unpickled from older versions work.
+    _transitions_cache_size = 8
+
     def transitions(self, year):
         """
         For a given year, get the DST on and off transition times, expressed
@@ -1010,13 +1092,31 @@ class tzrange(tzrangebase):
         if not self.hasdst:
             return None
 
+        cache = self.__dict__.get('_transitions_cache', None)
+        if cache is None:
+            cache = self._transitions_cache = {}
+        else:
+            try:
+                return cache[year]
+            except KeyError:
+                pass
+
         base_year = datetime.datetime(year, 1, 1)
 
         start = base_year + self._start_delta
         end = base_year + self._end_delta
 
+        if len(cache) >= self._transitions_cache_size:
+            cache.clear()
+        cache[year] = (start, end)
+
         return (start, end)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_transitions_cache', None)
+        return state
+
     def __eq__(self, other):
         if not isinstance(other, tzrange):
             return NotImplemented
@@ -1033,6 +1133,78 @@ class tzrange(tzrangebase):
         return self._dst_base_offset_
 
 
+# The most common shapes of a POSIX TZ string: "std offset [dst [offset]]",
+# optionally followed by ",Mm.w.d[/hh],Mm.w.d[/hh]" transition rules.
+_POSIX_TZSTR_RE = re.compile(
+    r'([A-Za-z]{3,})([+-]?)([0-9]{1,2})'
+    r'(?:([A-Za-z]{3,})(?:([+-]?)([0-9]{1,2}))?'
+    r'(?:,M([0-9]{1,2})\.([0-9])\.([0-9])(?:/([0-9]{1,2}))?'
+    r',M([0-9]{1,2})\.([0-9])\.([0-9])(?:/([0-9]{1,2}))?)?)?\Z')
+
+
+class _tzstrresult(object):
+    """
+    Stand-in for the result of ``dateutil.parser._parsetz``, produced by
+    :func:`_parse_posix_tzstr`.
+    """
+    __slots__ = ["stdabbr", "stdoffset", "dstabbr", "dstoffset",
+                 "start", "end", "any_unused_tokens"]
+
+    class _attr(object):
+        __slots__ = ["month", "week", "weekday",
+                     "yday", "jyday", "day", "time"]
+
+        def __init__(self):
+            for attr in self.__slots__:
+                setattr(self, attr, None)
+
+    def __init__(self):
+        for attr in self.__slots__:
+            setattr(self, attr, None)
+
+        self.start = self._attr()
+        self.end = self._attr()
+        self.any_unused_tokens = False
+
+
+def _parse_posix_tzstr(s):
+    """
+    Parse the common forms of a POSIX ``TZ`` string matched by
+    ``_POSIX_TZSTR_RE`` without invoking the general-purpose parser. Returns
+    ``None`` for any other string, which should then go to ``_parsetz``.
+    """
+    m = _POSIX_TZSTR_RE.match(s)
+    if m is None:
+        return None
+
+    groups = m.groups()
+
+    res = _tzstrresult()
+    res.stdabbr = groups[0]
+    res.stdoffset = _posix_tzstr_offset(groups[1], groups[2])
+    res.dstabbr = groups[3]
+    if groups[5] is not None:
+        res.dstoffset = _posix_tzstr_offset(groups[4], groups[5])
+
+    if groups[6] is not None:
+        for x, (month, week, weekday, hours) in ((res.start, groups[6:10]),
+                                                 (res.end, groups[10:14])):
+            x.month = int(month)
+            x.week = int(week)
+            if x.week == 5:
+                x.week = -1
+            x.weekday = (int(weekday) - 1) % 7
+            if hours is not None:
+                x.time = int(hours) * 3600
+
+    return res
+
+
+def _posix_tzstr_offset(sign, hours):
+    # POSIX offsets are west of UTC, so "EST5" is 5 hours *behind* UTC
+    return int(hours) * 3600 * (1 if sign == '-' else -1)
+
+
 @six.add_metaclass(_TzStrFactory)
 class tzstr(tzrange):
     """
@@ -1077,12 +1249,14 @@ class tzstr(tzrange):
         https://www.gnu.org/software/libc/manual/html_node/TZ-Variable.html
     """
     def __init__(self, s, posix_offset=False):
-        global parser
-        from dateutil.parser import _parser as parser
-
         self._s = s
 
-        res = parser._parsetz(s)
+        res = None
+        if isinstance(s, string_types):
+            res = _parse_posix_tzstr(s)
+
+        if res is None:
+            res = _get_parser()._parsetz(s)
         if res is None or res.any_unused_tokens:
             raise ValueError("unknown string format")
 
@@ -1109,7 +1283,7 @@ class tzstr(tzrange):
         self.hasdst = bool(self._start_delta)
 
     def _delta(self, x, isend=0):
-        from dateutil import relativedelta
+        relativedelta = _get_relativedelta()
         kwargs = {}
         if x.month is not None:
             kwargs["month"] = x.month
@@ -1160,7 +1334,7 @@ class _tzicalvtzcomp(object):
         self.tzoffsetto = datetime.timedelta(seconds=tzoffsetto)
         self.tzoffsetdiff = self.tzoffsetto - self.tzoffsetfrom
         self.isdst = isdst
-        self.tzname = tzname
+        self.tzname = _intern_name(tzname)
         self.rrule = rrule
 
 
@@ -1170,32 +1344,61 @@ class _tzicalvtz(_tzinfo):
 
         self._tzid = tzid
         self._comps = comps
-        self._cachedate = []
-        self._cachecomp = []
+        self._cache = OrderedDict()
+        self._cache_size = 512
         self._cache_lock = _thread.allocate_lock()
+        self._transitions_by_year = OrderedDict()
+        self._transitions_by_year_size = 64
+
+        # Components (with their position in comps) sorted by first onset,
+        # so lookups can skip components that have not started yet.
+        by_onset = []
+        for idx, comp in enumerate(comps):
+            first_onset = next(iter(comp.rrule), None)
+            if first_onset is not None:
+                by_onset.append((first_onset, idx, comp))
+        by_onset.sort(key=lambda x: x[:2])
+
+        self._first_onsets = [first_onset for first_onset, _, _ in by_onset]
+        self._comps_by_onset = [(idx, comp) for _, idx, comp in by_onset]
+
+        # In a fold, _find_compdt may look up to this far past dt
+        self._max_fold_shift = max([-comp.tzoffsetdiff for comp in comps
+                                    if comp.tzoffsetdiff < ZERO] or [ZERO])
 
     def _find_comp(self, dt):
         if len(self._comps) == 1:
             return self._comps[0]
 
-        dt = dt.replace(tzinfo=None)
+        # Recurrences never carry microseconds, so dropping them does not
+        # change the result and lets every datetime in the same second share
+        # one cache entry.
+        dt = dt.replace(tzinfo=None, microsecond=0)
+        fold = self._fold(dt)
+        key = (dt, fold)
 
-        try:
-            with self._cache_lock:
-                return self._cachecomp[self._cachedate.index(
-                    (dt, self._fold(dt)))]
-        except ValueError:
-            pass
+        with self._cache_lock:
+            comp = self._cache.pop(key, None)
+            if comp is not None:
+                self._cache[key] = comp
+                return comp
 
         lastcompdt = None
         lastcomp = None
+        lastidx = None
 
-        for comp in self._comps:
+        latest_dt = dt + self._max_fold_shift if fold else dt
+        n_started = bisect.bisect_right(self._first_onsets, latest_dt)
+
+        for idx, comp in self._comps_by_onset[:n_started]:
             compdt = self._find_compdt(comp, dt)
 
-            if compdt and (not lastcompdt or lastcompdt < compdt):
+            # On a tie, the component listed first wins
+            if compdt and (not lastcompdt or lastcompdt < compdt or
+                           (lastcompdt == compdt and idx < lastidx)):
                 lastcompdt = compdt
                 lastcomp = comp
+                lastidx = idx
 
         if not lastcomp:
             # RFC says nothing about what to do when a given
@@ -1210,12 +1413,10 @@ class _tzicalvtz(_tzinfo):
                 lastcomp = comp[0]
 
         with self._cache_lock:
-            self._cachedate.insert(0, (dt, self._fold(dt)))
-            self._cachecomp.insert(0, lastcomp)
+            self._cache[key] = lastcomp
 
-            if len(self._cachedate) > 10:
-                self._cachedate.pop()
-                self._cachecomp.pop()
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
 
         return lastcomp
 
@@ -1223,9 +1424,46 @@ class _tzicalvtz(_tzinfo):
         if comp.tzoffsetdiff < ZERO and self._fold(dt):
             dt -= comp.tzoffsetdiff
 
-        compdt = comp.rrule.before(dt, inc=True)
+        # Equivalent to comp.rrule.before(dt, inc=True), without generating
+        # the recurrence again on every lookup.
+        onsets = self._transitions_for(dt.year)[comp]
+        idx = bisect.bisect_right(onsets, dt)
 
-        return compdt
+        return onsets[idx - 1] if idx else None
+
+    def _transitions_for(self, year):
+        """
+        For each component, the sorted onsets falling within ``year``, preceded
+        by the last onset before ``year`` (if there is one).
+        """
+        with self._cache_lock:
+            transitions = self._transitions_by_year.pop(year, None)
+            if transitions is not None:
+                self._transitions_by_year[year] = transitions
+                return transitions
+
+        start = datetime.datetime(year, 1, 1)
+        if year < datetime.MAXYEAR:
+            end = datetime.datetime(year + 1, 1, 1)
+        else:
+            end = datetime.datetime.max
+
+        transitions = {}
+        for comp in self._comps:
+            onsets = comp.rrule.between(start, end, inc=True)
+            prev_onset = comp.rrule.before(start)
+            if prev_onset is not None:
+                onsets.insert(0, prev_onset)
+
+            transitions[comp] = onsets
+
+        with self._cache_lock:
+            self._transitions_by_year[year] = transitions
+
+            if len(self._transitions_by_year) > self._transitions_by_year_size:
+                self._transitions_by_year.popitem(last=False)
+
+        return transitions
 
     def utcoffset(self, dt):
         if dt is None:
@@ -1262,21 +1500,18 @@ class tzical(object):
     .. _`RFC 5545`: https://tools.ietf.org/html/rfc5545
     """
     def __init__(self, fileobj):
-        global rrule
-        from dateutil import rrule
-
         if isinstance(fileobj, string_types):
             self._s = fileobj
             # ical should be encoded in UTF-8 with CRLF
-            fileobj = open(fileobj, 'r')
+            with open(fileobj, 'r') as fobj:
+                s = fobj.read()
         else:
             self._s = getattr(fileobj, 'name', repr(fileobj))
-            fileobj = _nullcontext(fileobj)
+            s = fileobj.read()
 
         self._vtz = {}
 
-        with fileobj as fobj:
-            self._parse_rfc(fobj.read())
+        self._parse_rfc(s)
 
     def keys(self):
         """
@@ -1315,39 +1550,37 @@ class tzical(object):
         s = s.strip()
         if not s:
             raise ValueError("empty offset")
-        if s[0] in ('+', '-'):
-            signal = (-1, +1)[s[0] == '+']
-            s = s[1:]
-        else:
-            signal = +1
-        if len(s) == 4:
-            return (int(s[:2]) * 3600 + int(s[2:]) * 60) * signal
-        elif len(s) == 6:
-            return (int(s[:2]) * 3600 + int(s[2:4]) * 60 + int(s[4:])) * signal
-        else:
+
+        m = _ICAL_OFFSET_RE.match(s)
+        if m is None:
             raise ValueError("invalid offset: " + s)
 
+        sign, hours, minutes, seconds = m.groups()
+        offset = int(hours) * 3600 + int(minutes) * 60 + int(seconds or 0)
+
+        return -offset if sign == '-' else offset
+
     def _parse_rfc(self, s):
+        rrule = _get_rrule()
+
         lines = s.splitlines()
         if not lines:
             raise ValueError("empty string")
 
         # Unfold
-        i = 0
-        while i < len(lines):
-            line = lines[i].rstrip()
-            if not line:
-                del lines[i]
-            elif i > 0 and line[0] == " ":
-                lines[i-1] += line[1:]
-                del lines[i]
+        unfolded = []
+        for line in lines:
+            stripped = line.rstrip()
+            if not stripped:
+                continue
+            elif unfolded and stripped[0] == " ":
+                unfolded[-1] += stripped[1:]
             else:
-                i += 1
+                unfolded.append(line)
+        lines = unfolded
 
-        tzid = None
-        comps = []
-        invtz = False
-        comptype = None
+        # Parse state of the VTIMEZONE being read, or None outside of one
+        vtz = None
         for line in lines:
             if not line:
                 continue
@@ -1357,105 +1590,138 @@ class tzical(object):
                 raise ValueError("empty property name")
             name = parms[0].upper()
             parms = parms[1:]
-            if invtz:
-                if name == "BEGIN":
-                    if value in ("STANDARD", "DAYLIGHT"):
-                        # Process component
-                        pass
-                    else:
-                        raise ValueError("unknown component: "+value)
-                    comptype = value
-                    founddtstart = False
-                    tzoffsetfrom = None
-                    tzoffsetto = None
-                    rrulelines = []
-                    tzname = None
-                elif name == "END":
-                    if value == "VTIMEZONE":
-                        if comptype:
-                            raise ValueError("component not closed: "+comptype)
-                        if not tzid:
-                            raise ValueError("mandatory TZID not found")
-                        if not comps:
-                            raise ValueError(
-                                "at least one component is needed")
-                        # Process vtimezone
-                        self._vtz[tzid] = _tzicalvtz(tzid, comps)
-                        invtz = False
-                    elif value == comptype:
-                        if not founddtstart:
-                            raise ValueError("mandatory DTSTART not found")
-                        if tzoffsetfrom is None:
-                            raise ValueError(
-                                "mandatory TZOFFSETFROM not found")
-                        if tzoffsetto is None:
-                            raise ValueError(
-                                "mandatory TZOFFSETFROM not found")
-                        # Process component
-                        rr = None
-                        if rrulelines:
-                            rr = rrule.rrulestr("\n".join(rrulelines),
-                                                compatible=True,
-                                                ignoretz=True,
-                                                cache=True)
-                        comp = _tzicalvtzcomp(tzoffsetfrom, tzoffsetto,
-                                              (comptype == "DAYLIGHT"),
-                                              tzname, rr)
-                        comps.append(comp)
-                        comptype = None
-                    else:
-                        raise ValueError("invalid component end: "+value)
-                elif comptype:
-                    if name == "DTSTART":
-                        # DTSTART in VTIMEZONE takes a subset of valid RRULE
-                        # values under RFC 5545.
-                        for parm in parms:
-                            if parm != 'VALUE=DATE-TIME':
-                                msg = ('Unsupported DTSTART param in ' +
-                                       'VTIMEZONE: ' + parm)
-                                raise ValueError(msg)
-                        rrulelines.append(line)
-                        founddtstart = True
-                    elif name in ("RRULE", "RDATE", "EXRULE", "EXDATE"):
-                        rrulelines.append(line)
-                    elif name == "TZOFFSETFROM":
-                        if parms:
-                            raise ValueError(
-                                "unsupported %s parm: %s " % (name, parms[0]))
-                        tzoffsetfrom = self._parse_offset(value)
-                    elif name == "TZOFFSETTO":
-                        if parms:
-                            raise ValueError(
-                                "unsupported TZOFFSETTO parm: "+parms[0])
-                        tzoffsetto = self._parse_offset(value)
-                    elif name == "TZNAME":
-                        if parms:
-                            raise ValueError(
-                                "unsupported TZNAME parm: "+parms[0])
-                        tzname = value
-                    elif name == "COMMENT":
-                        pass
-                    else:
-                        raise ValueError("unsupported property: "+name)
+            if vtz is None:
+                if name == "BEGIN" and value == "VTIMEZONE":
+                    vtz = {'tzid': None, 'comps': [], 'comptype': None}
+            elif name == "BEGIN":
+                if value not in ("STANDARD", "DAYLIGHT"):
+                    raise ValueError("unknown component: "+value)
+                vtz.update(comptype=value,
+                           founddtstart=False,
+                           tzoffsetfrom=None,
+                           tzoffsetto=None,
+                           rrulelines=[],
+                           tzname=None)
+            elif name == "END":
+                if value == "VTIMEZONE":
+                    if vtz['comptype']:
+                        raise ValueError("component not closed: " +
+                                         vtz['comptype'])
+                    if not vtz['tzid']:
+                        raise ValueError("mandatory TZID not found")
+                    if not vtz['comps']:
+                        raise ValueError(
+                            "at least one component is needed")
+                    # Process vtimezone
+                    self._vtz[vtz['tzid']] = _tzicalvtz(vtz['tzid'],
+                                                        vtz['comps'])
+                    vtz = None
+                elif value == vtz['comptype']:
+                    if not vtz['founddtstart']:
+                        raise ValueError("mandatory DTSTART not found")
+                    if vtz['tzoffsetfrom'] is None:
+                        raise ValueError(
+                            "mandatory TZOFFSETFROM not found")
+                    if vtz['tzoffsetto'] is None:
+                        raise ValueError(
+                            "mandatory TZOFFSETFROM not found")
+                    # Process component
+                    rr = None
+                    if vtz['rrulelines']:
+                        rr = rrule.rrulestr("\n".join(vtz['rrulelines']),
+                                            compatible=True,
+                                            ignoretz=True,
+                                            cache=True)
+                    comp = _tzicalvtzcomp(vtz['tzoffsetfrom'],
+                                          vtz['tzoffsetto'],
+                                          (vtz['comptype'] == "DAYLIGHT"),
+                                          vtz['tzname'], rr)
+                    vtz['comps'].append(comp)
+                    vtz['comptype'] = None
                 else:
-                    if name == "TZID":
-                        if parms:
-                            raise ValueError(
-                                "unsupported TZID parm: "+parms[0])
-                        tzid = value
-                    elif name in ("TZURL", "LAST-MODIFIED", "COMMENT"):
-                        pass
-                    else:
-                        raise ValueError("unsupported property: "+name)
-            elif name == "BEGIN" and value == "VTIMEZONE":
-                tzid = None
-                comps = []
-                invtz = True
+                    raise ValueError("invalid component end: "+value)
+            else:
+                if vtz['comptype']:
+                    handler = self._COMP_PROPERTY_HANDLERS.get(name)
+                else:
+                    handler = self._VTZ_PROPERTY_HANDLERS.get(name)
+
+                if handler is None:
+                    raise ValueError("unsupported property: "+name)
+
+                handler(self, vtz, parms, value, line)
+
+    def _parse_comp_dtstart(self, vtz, parms, value, line):
+        # DTSTART in VTIMEZONE takes a subset of valid RRULE
+        # values under RFC 5545.
+        for parm in parms:
+            if parm != 'VALUE=DATE-TIME':
+                msg = ('Unsupported DTSTART param in ' +
+                       'VTIMEZONE: ' + parm)
+                raise ValueError(msg)
+        vtz['rrulelines'].append(line)
+        vtz['founddtstart'] = True
+
+    def _parse_comp_rrule(self, vtz, parms, value, line):
+        vtz['rrulelines'].append(line)
+
+    def _parse_comp_tzoffsetfrom(self, vtz, parms, value, line):
+        if parms:
+            raise ValueError(
+                "unsupported %s parm: %s " % ("TZOFFSETFROM", parms[0]))
+        vtz['tzoffsetfrom'] = self._parse_offset(value)
+
+    def _parse_comp_tzoffsetto(self, vtz, parms, value, line):
+        if parms:
+            raise ValueError("unsupported TZOFFSETTO parm: "+parms[0])
+        vtz['tzoffsetto'] = self._parse_offset(value)
+
+    def _parse_comp_tzname(self, vtz, parms, value, line):
+        if parms:
+            raise ValueError("unsupported TZNAME parm: "+parms[0])
+        vtz['tzname'] = value
+
+    def _parse_vtz_tzid(self, vtz, parms, value, line):
+        if parms:
+            raise ValueError("unsupported TZID parm: "+parms[0])
+        vtz['tzid'] = value
+
+    def _parse_ignored(self, vtz, parms, value, line):
+        pass
+
+    # Handlers for the properties allowed inside a STANDARD or DAYLIGHT
+    # component, and directly inside a VTIMEZONE, respectively.
+    _COMP_PROPERTY_HANDLERS = {
+        "DTSTART": _parse_comp_dtstart,
+        "RRULE": _parse_comp_rrule,
+        "RDATE": _parse_comp_rrule,
+        "EXRULE": _parse_comp_rrule,
+        "EXDATE": _parse_comp_rrule,
+        "TZOFFSETFROM": _parse_comp_tzoffsetfrom,
+        "TZOFFSETTO": _parse_comp_tzoffsetto,
+        "TZNAME": _parse_comp_tzname,
+        "COMMENT": _parse_ignored,
+    }
+
+    _VTZ_PROPERTY_HANDLERS = {
+        "TZID": _parse_vtz_tzid,
+        "TZURL": _parse_ignored,
+        "LAST-MODIFIED": _parse_ignored,
+        "COMMENT": _parse_ignored,
+    }
 
     def __repr__(self):
         return "%s(%s)" % (self.__class__.__name__, repr(self._s))
 
 
+if sys.version_info >= (3, 7):
+    # dict preserves insertion order, and is smaller and faster than
+    # OrderedDict
+    _lru_dict = dict
+else:
+    _lru_dict = OrderedDict
+
+
 if sys.platform != "win32":
     TZFILES = ["/etc/localtime", "localtime"]
     TZPATHS = ["/usr/share/zoneinfo",
@@ -1472,6 +1738,64 @@ def __get_gettz():
     if tzwinlocal is not None:
         tzlocal_classes += (tzwinlocal,)
 
+    # Maps (name, TZPATHS) to the zone file that name resolved to, or to
+    # None if no file in TZPATHS could be loaded, so that repeated lookups
+    # don't have to probe the file system again. The local zone, found by
+    # searching TZFILES, is stored under (None, TZPATHS, TZFILES), but only
+    # once a file has been found, so that one created later is still used.
+    tzpath_cache = {}
+    tzpath_cache_size = 1024
+
+    def cache_tzpath(key, filepath):
+        if len(tzpath_cache) >= tzpath_cache_size:
+            tzpath_cache.clear()
+        tzpath_cache[key] = filepath
+
+    # The entries of TZPATHS with a trailing separator, so that candidate
+    # paths can be built by concatenation rather than os.path.join.
+    tzpath_prefixes = {}
+
+    def get_tzpath_prefixes(tzpaths):
+        try:
+            return tzpath_prefixes[tzpaths]
+        except KeyError:
+            prefixes = tuple(os.path.join(path, '') for path in tzpaths)
+            tzpath_prefixes.clear()
+            tzpath_prefixes[tzpaths] = prefixes
+            return prefixes
+
+    # Parsed zone files, keyed by path and checked against the identity,
+    # size and modification time of the file that path currently opens, so
+    # that zones which have dropped out of the instance caches can be
+    # rebuilt without re-parsing the file.
+    tzdata_cache = {}
+    tzdata_cache_size = 64
+
+    def load_tzfile(filepath):
+        with open(filepath, 'rb') as fileobj:
+            # fstat the opened file rather than stat the path, so that a
+            # symlink that has been re-pointed is seen as a different file
+            st = os.fstat(fileobj.fileno())
+            signature = (st.st_dev, st.st_ino, st.st_size, st.st_mtime)
+
+            cached = tzdata_cache.get(filepath, None)
+            if cached is not None and cached[0] == signature:
+                # Same construction as used when unpickling a tzfile
+                tz = tzfile(None, filepath)
+                tz._set_tzdata(cached[1])
+                return tz
+
+            tz = tzfile(fileobj, filename=filepath)
+
+        tzobj = _tzfile(**dict((attr, getattr(tz, '_' + attr))
+                               for attr in _tzfile.attrs))
+
+        if len(tzdata_cache) >= tzdata_cache_size:
+            tzdata_cache.clear()
+        tzdata_cache[filepath] = (signature, tzobj)
+
+        return tz
+
     class GettzFunc(object):
         """
         Retrieve a time zone object from a string representation
@@ -1535,6 +1859,17 @@ def __get_gettz():
             In addition to improving performance, this ensures that
             `"same zone" semantics`_ are used for datetimes in the same zone.
 
+        .. versionchanged:: 2.8.2
+
+            ``"UTC"`` and its aliases ``"Etc/UTC"``, ``"Universal"``,
+            ``"Etc/Universal"``, ``"Zulu"`` and ``"Etc/Zulu"`` return the
+            :data:`dateutil.tz.UTC` singleton rather than a :class:`tzfile`:
+
+            .. code-block:: python3
+
+                >>> tz.gettz('UTC') is tz.UTC
+                True
+
 
         .. _`TZ variable`:
             https://www.gnu.org/software/libc/manual/html_node/TZ-Variable.html
@@ -1544,17 +1879,72 @@ def __get_gettz():
         """
         def __init__(self):
 
-            self.__instances = weakref.WeakValueDictionary()
+            # Weak references to zones that have been pushed out of the
+            # strong cache, so that anyone still holding one gets the same
+            # object back. Zones in the strong cache are not listed here.
+            # Dead references are dropped under the lock, when looked up or
+            # when the dict has grown enough to be worth sweeping.
+            self.__weak_cache = {}
+            self.__weak_cache_sweep_size = 64
             self.__strong_cache_size = 8
-            self.__strong_cache = OrderedDict()
+            self.__strong_cache = _lru_dict()
             self._cache_lock = _thread.allocate_lock()
+            # Events for the names currently being loaded, so that threads
+            # missing on the same name wait for a single load.
+            self.__pending = {}
 
         def __call__(self, name=None):
-            with self._cache_lock:
-                rv = self.__instances.get(name, None)
+            # Cache hits don't wait for the lock: a single dict lookup is
+            # atomic, and the entry is only moved to the most recently used
+            # end if the lock happens to be free.
+            rv = self.__strong_cache.get(name, None)
+            if rv is not None:
+                if self._cache_lock.acquire(False):
+                    try:
+                        cached = self.__strong_cache.pop(name, None)
+                        if cached is not None:
+                            self.__strong_cache[name] = cached
+                    finally:
+                        self._cache_lock.release()
+
+                return rv
+
+            # Interning the key costs a lookup of its own, so it is only done
+            # on the slow path; once the cache holds the interned string,
+            # lookups with string literals match it by identity.
+            name = _intern_name(name)
+            while True:
+                with self._cache_lock:
+                    # Check again, in case another thread added it in the
+                    # meantime
+                    rv = self.__strong_cache.pop(name, None)
+                    if rv is not None:
+                        self.__strong_cache[name] = rv
+                        return rv
+
+                    ref = self.__weak_cache.pop(name, None)
+                    rv = ref() if ref is not None else None
+                    if rv is not None:
+                        self.__add_strong(name, rv)
+                        return rv
 
-                if rv is None:
-                    rv = self.nocache(name=name)
+                    pending = self.__pending.get(name, None)
+                    if pending is None:
+                        pending = self.__pending[name] = threading.Event()
+                        break
+
+                # Another thread is loading this name; wait for it to finish
+                # and look again.
+                pending.wait()
+
+            # The zone is loaded without holding the lock, so that misses on
+            # other names are not held up by this one.
+            rv = None
+            try:
+                rv = self.nocache(name=name)
+            finally:
+                with self._cache_lock:
+                    del self.__pending[name]
                     if not (name is None
                             or isinstance(rv, tzlocal_classes)
                             or rv is None):
@@ -1564,32 +1954,78 @@ def __get_gettz():
                         #
                         # We also cannot store weak references to None, so we
                         # will also not store that.
-                        self.__instances[name] = rv
-                    else:
-                        # No need for strong caching, return immediately
-                        return rv
+                        self.__add_strong(name, rv)
+                pending.set()
 
-                self.__strong_cache[name] = self.__strong_cache.pop(name, rv)
+            return rv
 
-                if len(self.__strong_cache) > self.__strong_cache_size:
-                    self.__strong_cache.popitem(last=False)
+        def __add_strong(self, name, rv):
+            # Callers hold the lock and have checked that name is not in the
+            # strong cache, so this adds an entry and may overfill the cache.
+            self.__strong_cache[name] = rv
 
-            return rv
+            if len(self.__strong_cache) > self.__strong_cache_size:
+                self.__evict_oldest()
+
+        def __evict_oldest(self):
+            # Demote the least recently used zone to a weak reference
+            name = next(iter(self.__strong_cache))
+            self.__add_weak(name, self.__strong_cache.pop(name))
+
+        def __add_weak(self, name, rv):
+            # Callers hold the lock
+            weak_cache = self.__weak_cache
+            if len(weak_cache) >= self.__weak_cache_sweep_size:
+                for dead in [k for k, ref in weak_cache.items()
+                             if ref() is None]:
+                    del weak_cache[dead]
+
+                self.__weak_cache_sweep_size = max(64, 2 * len(weak_cache))
+
+            weak_cache[name] = weakref.ref(rv)
 
         def set_cache_size(self, size):
             with self._cache_lock:
                 self.__strong_cache_size = size
-                while len(self.__strong_cache) > size:
-                    self.__strong_cache.popitem(last=False)
+                excess = len(self.__strong_cache) - size
+                if excess > 0:
+                    # Rebuild the cache in one pass rather than evicting the
+                    # oldest entries one at a time
+                    items = list(self.__strong_cache.items())
+                    self.__strong_cache = _lru_dict(items[excess:])
+                    for name, rv in items[:excess]:
+                        self.__add_weak(name, rv)
 
         def cache_clear(self):
+            """
+            Clear the instance cache, and the zone file lookups remembered by
+            :func:`gettz.nocache`.
+            """
             with self._cache_lock:
-                self.__instances = weakref.WeakValueDictionary()
+                self.__weak_cache = {}
                 self.__strong_cache.clear()
+                tzpath_cache.clear()
+                tzdata_cache.clear()
 
         @staticmethod
         def nocache(name=None):
-            """A non-cached version of gettz"""
+            """
+            A version of gettz that bypasses its instance cache and loads the
+            time zone again on each call.
+
+            Zone file lookups are still remembered between calls: where in
+            ``TZPATHS`` (or ``TZFILES``, for the local zone) each name was
+            found or that it was not found, and the parsed contents of
+            recently read zone files. Changes to the contents of a zone file,
+            or a symlink re-pointed to another file, are picked up on the next
+            call, but a zone file added to ``TZPATHS`` after a name has been
+            looked up is not. Call :func:`gettz.cache_clear` after changing
+            the installed zone files to make sure they are all re-read.
+            """
+            # Bound locally since they are called in the TZPATHS loops
+            isabs = os.path.isabs
+            isfile = os.path.isfile
+
             tz = None
             if not name:
                 try:
@@ -1597,23 +2033,38 @@ def __get_gettz():
                 except KeyError:
                     pass
             if name is None or name == ":":
-                for filepath in TZFILES:
-                    if not os.path.isabs(filepath):
-                        filename = filepath
-                        for path in TZPATHS:
-                            filepath = os.path.join(path, filename)
-                            if os.path.isfile(filepath):
+                tzpaths = tuple(TZPATHS)
+                key = (None, tzpaths, tuple(TZFILES))
+                resolved = tzpath_cache.get(key, None)
+                if resolved is not None:
+                    try:
+                        tz = load_tzfile(resolved)
+                    except (IOError, OSError, ValueError):
+                        tzpath_cache.pop(key, None)
+                        resolved = None
+
+                if resolved is None:
+                    for filepath in TZFILES:
+                        if not isabs(filepath):
+                            filename = filepath
+                            for prefix in get_tzpath_prefixes(tzpaths):
+                                filepath = prefix + filename
+                                if isfile(filepath):
+                                    break
+                            else:
+                                continue
+                        if isfile(filepath):
+                            try:
+                                tz = load_tzfile(filepath)
+                                resolved = filepath
                                 break
-                        else:
-                            continue
-                    if os.path.isfile(filepath):
-                        try:
-                            tz = tzfile(filepath)
-                            break
-                        except (IOError, OSError, ValueError):
-                            pass
-                else:
-                    tz = tzlocal()
+                            except (IOError, OSError, ValueError):
+                                pass
+                    else:
+                        tz = tzlocal()
+
+                    if resolved is not None:
+                        cache_tzpath(key, resolved)
             else:
                 try:
                     if name.startswith(":"):
@@ -1624,24 +2075,50 @@ def __get_gettz():
                         six.raise_from(TypeError(new_msg), e)
                     else:
                         raise
-                if os.path.isabs(name):
-                    if os.path.isfile(name):
-                        tz = tzfile(name)
+                if name in _UTC_ZONE_NAMES:
+                    tz = UTC
+                elif isabs(name):
+                    if isfile(name):
+                        tz = load_tzfile(name)
                     else:
                         tz = None
                 else:
-                    for path in TZPATHS:
-                        filepath = os.path.join(path, name)
-                        if not os.path.isfile(filepath):
-                            filepath = filepath.replace(' ', '_')
-                            if not os.path.isfile(filepath):
-                                continue
+                    tzpaths = tuple(TZPATHS)
+                    key = (name, tzpaths)
+                    resolved = tzpath_cache.get(key, False)
+                    if resolved:
                         try:
-                            tz = tzfile(filepath)
-                            break
+                            tz = load_tzfile(resolved)
                         except (IOError, OSError, ValueError):
-                            pass
-                    else:
+                            # The file changed since it was resolved
+                            resolved = False
+
+                    if resolved is False:
+                        resolved = None
+                        # Opening the file directly is cheaper than checking
+                        # that it exists first; a missing file just raises.
+                        for prefix in get_tzpath_prefixes(tzpaths):
+                            filepath = prefix + name
+                            try:
+                                tz = load_tzfile(filepath)
+                            except (IOError, OSError):
+                                if ' ' not in filepath:
+                                    continue
+
+                                filepath = filepath.replace(' ', '_')
+                                try:
+                                    tz = load_tzfile(filepath)
+                                except (IOError, OSError, ValueError):
+                                    continue
+                            except ValueError:
+                                continue
+
+                            resolved = filepath
+                            break
+
+                        cache_tzpath(key, resolved)
+
+                    if resolved is None:
                         tz = None
                         if tzwin is not None:
                             try:
@@ -1651,26 +2128,21 @@ def __get_gettz():
                                 tz = None
 
                         if not tz:
-                            from dateutil.zoneinfo import get_zonefile_instance
-                            tz = get_zonefile_instance().get(name)
+                            zoneinfo = _get_zoneinfo()
+                            tz = zoneinfo.get_zonefile_instance().get(name)
 
                         if not tz:
-                            for c in name:
-                                # name is not a tzstr unless it has at least
-                                # one offset. For short values of "name", an
-                                # explicit for loop seems to be the fastest way
-                                # To determine if a string contains a digit
-                                if c in "0123456789":
-                                    try:
-                                        tz = tzstr(name)
-                                    except ValueError:
-                                        pass
-                                    break
-                            else:
-                                if name in ("GMT", "UTC"):
-                                    tz = UTC
-                                elif name in time.tzname:
-                                    tz = tzlocal()
+                            # name is not a tzstr unless it has at least
+                            # one offset
+                            if _HAS_DIGIT_RE.search(name):
+                                try:
+                                    tz = tzstr(name)
+                                except ValueError:
+                                    pass
+                            elif name in ("GMT", "UTC"):
+                                tz = UTC
+                            elif name in time.tzname:
+                                tz = tzlocal()
             return tz
 
     return GettzFunc()
@@ -1704,14 +2176,12 @@ def datetime_exists(dt, tz=None):
             raise ValueError('Datetime is naive and no time zone provided.')
         tz = dt.tzinfo
 
-    dt = dt.replace(tzinfo=None)
+    dt = dt.replace(tzinfo=tz)
 
     # This is essentially a test of whether or not the datetime can survive
-    # a round trip to UTC.
-    dt_rt = dt.replace(tzinfo=tz).astimezone(UTC).astimezone(tz)
-    dt_rt = dt_rt.replace(tzinfo=None)
-
-    return dt == dt_rt
+    # a round trip to UTC. Both sides share the same tzinfo, so the
+    # comparison is between the wall times alone.
+    return dt.astimezone(UTC).astimezone(tz) == dt
 
 
 def datetime_ambiguous(dt, tz=None):
@@ -1744,7 +2214,7 @@ def datetime_ambiguous(dt, tz=None):
     is_ambiguous_fn = getattr(tz, 'is_ambiguous', None)
     if is_ambiguous_fn is not None:
         try:
-            return tz.is_ambiguous(dt)
+            return is_ambiguous_fn(dt)
         except Exception:
             pass
 
@@ -1754,10 +2224,11 @@ def datetime_ambiguous(dt, tz=None):
     wall_0 = enfold(dt, fold=0)
     wall_1 = enfold(dt, fold=1)
 
-    same_offset = wall_0.utcoffset() == wall_1.utcoffset()
-    same_dst = wall_0.dst() == wall_1.dst()
+    # dst() is only consulted if the offsets alone don't settle it
+    if wall_0.utcoffset() != wall_1.utcoffset():
+        return True
 
-    return not (same_offset and same_dst)
+    return wall_0.dst() != wall_1.dst()
 
 
 def resolve_imaginary(dt):
@@ -1796,6 +2267,10 @@ def resolve_imaginary(dt):
 
     .. versionadded:: 2.7.0
     """
+    # Fixed offset zones have no gaps, so skip the round trip through UTC
+    if isinstance(dt.tzinfo, (tzutc, tzoffset)):
+        return dt
+
     if dt.tzinfo is not None and not datetime_exists(dt):
 
         curr_offset = (dt + datetime.timedelta(hours=24)).utcoffset()
@@ -1806,12 +2281,67 @@ def resolve_imaginary(dt):
     return dt
 
 
+# These modules are imported on first use rather than at import time, both to
+# keep "import dateutil.tz" cheap and because dateutil.parser and
+# dateutil.zoneinfo import this module.
+_relativedelta = None
+_rrule = None
+_parser = None
+_zoneinfo = None
+
+
+def _get_relativedelta():
+    global _relativedelta
+    if _relativedelta is None:
+        from dateutil import relativedelta as _relativedelta
+    return _relativedelta
+
+
+def _get_rrule():
+    global _rrule
+    if _rrule is None:
+        from dateutil import rrule as _rrule
+    return _rrule
+
+
+def _get_parser():
+    global _parser
+    if _parser is None:
+        from dateutil.parser import _parser
+    return _parser
+
+
+def _get_zoneinfo():
+    global _zoneinfo
+    if _zoneinfo is None:
+        from dateutil import zoneinfo as _zoneinfo
+    return _zoneinfo
+
+
+def _intern_name(name):
+    # Zone names and abbreviations are short strings shared by many instances;
+    # interning them saves memory and lets equality checks succeed on identity.
+    # intern() rejects str subclasses, so those are passed through unchanged.
+    if type(name) is str:
+        return intern(name)
+    return name
+
+
+def _datetime_to_whole_seconds(dt):
+    """
+    Like :func:`_datetime_to_timestamp`, but as an :class:`int` that leaves
+    out the microseconds.
+    """
+    return ((dt.toordinal() - EPOCHORDINAL) * 86400 + dt.hour * 3600 +
+            dt.minute * 60 + dt.second)
+
+
 def _datetime_to_timestamp(dt):
     """
     Convert a :class:`datetime.datetime` object to an epoch timestamp in
     seconds since January 1, 1970, ignoring the time zone.
     """
-    return (dt.replace(tzinfo=None) - EPOCH).total_seconds()
+    return _datetime_to_whole_seconds(dt) + dt.microsecond / 1e6
 
 
 if sys.version_info >= (3, 6):
@@ -1828,22 +2358,4 @@ else:
         return calculated_offset
 
 
-try:
-    # Python 3.7 feature
-    from contextlib import nullcontext as _nullcontext
-except ImportError:
-    class _nullcontext(object):
-        """
-        Class for wrapping contexts so that they are passed through in a
-        with statement.
-        """
-        def __init__(self, context):
-            self.context = context
-
-        def __enter__(self):
-            return self.context
-
-        def __exit__(*args, **kwargs):
-            pass
-
 # vim:ts=4:sw=4:et